@@ -0,0 +1,30 @@
+"""Ahead-of-time build for the backtest kernels.
+
+Running ``python _aot_build.py`` compiles the kernels in `_kernels.py`
+into a `backtest_aot` extension module next to this file. When that
+module is importable, `_kernels.py` uses it instead of @njit, so short
+CLI runs skip the multi-second first-call JIT compile entirely.
+
+The build is optional: without it the cached @njit path still works.
+"""
+from numba.pycc import CC
+
+import _kernels
+
+
+def build_cc() -> CC:
+    cc = CC('backtest_aot')
+    cc.output_dir = '.'
+    # The backtest sweep runs in float32 (see backtest_portfolio); the
+    # metrics sweep receives float64 arrays from compute_metrics.
+    cc.export('run_backtest', 'Tuple((f4[:], f4[:]))(f4[:,:], f4[:], f8)')(
+        getattr(_kernels.run_backtest, 'py_func', _kernels.run_backtest)
+    )
+    cc.export('run_metrics', 'Tuple((f8, f8, f8, f8))(f8[:], f8[:])')(
+        getattr(_kernels.run_metrics, 'py_func', _kernels.run_metrics)
+    )
+    return cc
+
+
+if __name__ == '__main__':
+    build_cc().compile()
@@ -0,0 +1,64 @@
+"""Disk cache for downloaded price data.
+
+Persists each `(tickers, start, end)` download as a parquet file under
+`.cache/prices/` so repeated CLI/Streamlit runs skip the yfinance round
+trip entirely. Entries expire by file age: requests whose end date is in
+the future (i.e. still accumulating fresh bars) get a 24 h TTL, fully
+historical requests keep their data for 7 days.
+"""
+import hashlib
+import os
+import time
+from datetime import date, datetime
+
+import pandas as pd
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "prices")
+
+RECENT_TTL_SECONDS = 24 * 60 * 60
+HISTORICAL_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def cache_path(tickers, start, end):
+    """Deterministic parquet path for a download request."""
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    key = hashlib.md5(repr((tuple(sorted(tickers)), start, end)).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.parquet")
+
+
+def ttl_for(end):
+    """TTL in seconds: short for still-live ranges, long for historical."""
+    try:
+        end_date = datetime.strptime(str(end), "%Y-%m-%d").date()
+    except ValueError:
+        return RECENT_TTL_SECONDS
+    return HISTORICAL_TTL_SECONDS if end_date < date.today() else RECENT_TTL_SECONDS
+
+
+def load_cached(path, ttl):
+    """Return the cached DataFrame, or None on miss/expiry/read error."""
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        cached = pd.read_parquet(path)
+    except (OSError, ValueError):
+        return None
+    # An empty frame means a failed download slipped into the cache
+    # (pre-fix); treat it as a miss so it gets retried.
+    return None if cached.empty else cached
+
+
+def store(path, data: pd.DataFrame):
+    """Write a download result to the cache; failures are non-fatal."""
+    if data.empty:
+        # An empty result means the download failed; caching it would
+        # serve the failure for the whole TTL.
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        data.to_parquet(path)
+    except (OSError, ValueError, ImportError):
+        # Missing parquet engine or an unwritable cache dir just means
+        # the next run re-downloads.
+        pass
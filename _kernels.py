@@ -0,0 +1,85 @@
+"""Numba-compiled kernels for the backtest hot path.
+
+Numba is optional: when it is not installed the kernels below run as
+plain Python/numpy functions, and `backtest.py` falls back to its
+vectorized numpy path instead of the jitted loops.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernels stay importable without numba.
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def run_backtest(P, w, initial):
+    """Fused backtest sweep: prices (T, N) -> (equity, port_returns).
+
+    One sequential pass computes the weighted daily return and compounds
+    the equity curve, with no intermediate (T, N) arrays.
+    """
+    T = P.shape[0]
+    N = P.shape[1]
+    returns = np.empty(T - 1, dtype=P.dtype)
+    equity = np.empty(T - 1, dtype=P.dtype)
+    eq = initial
+    for t in range(1, T):
+        r = 0.0
+        for j in range(N):
+            r += w[j] * (P[t, j] / P[t - 1, j] - 1.0)
+        returns[t - 1] = r
+        eq *= 1.0 + r
+        equity[t - 1] = eq
+    return equity, returns
+
+
+@njit(cache=True)
+def run_metrics(equity, returns):
+    """Single sweep over equity/returns -> (total, mean, std, max_drawdown).
+
+    Tracks the return sums and the running equity max in scalar registers
+    so no intermediate arrays (cummax, drawdown) are allocated. `std`
+    uses ddof=1 to match `pandas.Series.std`.
+    """
+    n = returns.shape[0]
+    sum_r = 0.0
+    sum_r2 = 0.0
+    running_max = equity[0]
+    max_drawdown = 0.0
+    for i in range(n):
+        r = returns[i]
+        sum_r += r
+        sum_r2 += r * r
+        v = equity[i]
+        if v > running_max:
+            running_max = v
+        dd = v / running_max - 1.0
+        if dd < max_drawdown:
+            max_drawdown = dd
+    mean = sum_r / n
+    var = (sum_r2 - n * mean * mean) / (n - 1) if n > 1 else np.nan
+    std = np.sqrt(var) if var > 0.0 else 0.0
+    total = equity[n - 1] / equity[0] - 1.0
+    return total, mean, std, max_drawdown
+
+
+# Prefer the ahead-of-time build (see _aot_build.py) when present: same
+# kernels, but the first call pays no JIT compilation latency.
+try:
+    import backtest_aot as _aot
+except ImportError:
+    pass
+else:
+    run_backtest = _aot.run_backtest
+    run_metrics = _aot.run_metrics
+    NUMBA_AVAILABLE = True
@@ -1,7 +1,8 @@
 from data import get_price_data
 from backtest import backtest_portfolio, compute_metrics
 import argparse
-from plot import plot_equity_curves, plot_drawdown, plot_monthly_returns, create_all_charts
+import math
+import pandas as pd
 
 def main():
     # tickers = ["AAPL", "OPEN", "TSLA", "SPY"]
@@ -78,10 +79,28 @@ def main():
     
     
     
-    prices = get_price_data(tickers, start, end)
-    
-    spy_prices = get_price_data(['SPY'], start, end)
-    
+    # One batched download covers the portfolio and the SPY benchmark
+    all_tickers = list(dict.fromkeys(tickers + ['SPY']))
+    data = get_price_data(all_tickers, start, end)
+
+    # Tickers that failed to download are simply absent from the result;
+    # warn and continue with the rest, like the Streamlit app does
+    missing_tickers = [t for t in tickers if t not in data.columns]
+    if missing_tickers:
+        print(f"Warning: no data found for: {', '.join(missing_tickers)} (skipped)")
+        tickers = [t for t in tickers if t in data.columns]
+
+    if not tickers:
+        print("Error: none of the requested tickers returned price data")
+        return
+
+    if 'SPY' not in data.columns:
+        print("Error: no data returned for the SPY benchmark")
+        return
+
+    prices = data[tickers]
+    spy_prices = data[['SPY']]
+
     n = len(tickers)
     
     if args.weights:
@@ -126,28 +145,20 @@ def main():
     print(f"{'Metric':<25} {'Portfolio':<20} {'SPY':<20}")
     print("=" * 70)
     
-    # Format and display each metric side-by-side
-    for metric in ['total_return', 'annual_return', 'annual_vol', 'sharpe', 'max_drawdown']:
-        portfolio_val = metrics[metric]
-        spy_val = spy_metrics[metric]
-        
-        # Format as percentage for returns and drawdown
-        if metric in ['total_return', 'annual_return', 'max_drawdown']:
-            portfolio_str = f"{portfolio_val:.2%}"
-            spy_str = f"{spy_val:.2%}"
-        # Format as decimal for volatility
-        elif metric == 'annual_vol':
-            portfolio_str = f"{portfolio_val:.2%}"
-            spy_str = f"{spy_val:.2%}"
-        # Format as decimal for sharpe
-        else:
-            portfolio_str = f"{portfolio_val:.4f}"
-            spy_str = f"{spy_val:.4f}"
-        
-        # Add indicator if portfolio outperforms
-        indicator = "✓" if portfolio_val > spy_val else " " if metric != 'max_drawdown' else ("✓" if portfolio_val > spy_val else " ")
-        
-        print(f"{metric.replace('_', ' ').title():<25} {portfolio_str:<20} {spy_str:<20}")
+    # Format the whole table column-wise: one vectorized map per format
+    # group instead of a per-cell if-ladder
+    metric_order = ['total_return', 'annual_return', 'annual_vol', 'sharpe', 'max_drawdown']
+    metrics_df = pd.DataFrame({'Portfolio': metrics, 'SPY': spy_metrics}).loc[metric_order]
+    pct_mask = metrics_df.index.isin(['total_return', 'annual_return', 'annual_vol', 'max_drawdown'])
+
+    formatted = metrics_df.astype(object)
+    formatted.loc[pct_mask] = metrics_df.loc[pct_mask].map(lambda v: f"{v:.2%}")
+    formatted.loc[~pct_mask] = metrics_df.loc[~pct_mask].map(
+        lambda v: f"{v:.4f}" if not math.isnan(v) else "N/A"
+    )
+
+    for metric, row in formatted.iterrows():
+        print(f"{metric.replace('_', ' ').title():<25} {row['Portfolio']:<20} {row['SPY']:<20}")
     
     print("=" * 70)
     print(f"\nFinal Values:")
@@ -163,6 +174,9 @@ def main():
     print(f"\nOutperformance: ${outperformance:,.2f} ({outperformance_pct:+.2f}%)")
     
     if args.plot or args.save_charts:
+        # Deferred so metrics-only runs never pay matplotlib's import cost
+        from plot import plot_equity_curves, plot_drawdown, plot_monthly_returns, create_all_charts
+
         print("\n" + "=" * 70)
         print("Generating visualizations...")
         print("=" * 70)
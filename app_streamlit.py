@@ -4,10 +4,11 @@ from typing import List, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.figure import Figure
 import pandas as pd
 import streamlit as st
 
-from backtest import backtest_portfolio, compute_metrics
+from backtest import backtest_portfolio, compute_metrics, monthly_compound_returns
 from data import get_price_data
 
 st.set_page_config(
@@ -58,27 +59,58 @@ def load_price_data(tickers: Sequence[str], start: str, end: str) -> pd.DataFram
     return data
 
 
-def format_metric_value(metric: str, value: float) -> str:
-    """Create human-readable strings for metric values."""
-    percentage_metrics = {"total_return", "annual_return", "annual_vol", "max_drawdown"}
-    if metric in percentage_metrics:
-        return f"{value:.2%}"
-
-    if metric == "sharpe":
-        return f"{value:.4f}" if not math.isnan(value) else "N/A"
-
-    return f"{value:.4f}"
+def _series_fingerprint(series: pd.Series):
+    """Cheap hash key for @st.cache_data instead of hashing every value."""
+    if series.empty:
+        return (0,)
+    return (series.index[0], series.index[-1], len(series), float(series.sum()))
 
 
+@st.cache_data(show_spinner=False, hash_funcs={pd.Series: _series_fingerprint})
 def compute_drawdown(curve: pd.Series) -> pd.Series:
-    running_max = curve.cummax()
-    drawdown = curve / running_max - 1
-    return drawdown.fillna(0)
+    # One buffer, in place: cummax/divide/subtract/fillna as chained
+    # Series ops would allocate four intermediates per chart render.
+    values = curve.to_numpy(dtype=np.float64)
+    out = np.maximum.accumulate(values)
+    np.divide(values, out, out=out)
+    out -= 1.0
+    np.nan_to_num(out, copy=False)
+    return pd.Series(out, index=curve.index)
 
 
+@st.cache_data(show_spinner=False, hash_funcs={pd.Series: _series_fingerprint})
 def monthly_returns(returns: pd.Series) -> pd.Series:
-    monthly = (1 + returns).resample("M").prod() - 1
-    return monthly.dropna()
+    return monthly_compound_returns(returns)
+
+
+def _session_figure(key: str, figsize: Tuple[float, float]):
+    """Memoize a (fig, ax) pair per chart slot.
+
+    Creating a Figure (canvas, fonts, layout engine) is the slow part of
+    each chart render, so reuse one Figure per chart type across reruns
+    and only redraw its artists. Figures are built directly rather than
+    through plt.subplots so they never enter pyplot's global registry,
+    which would leak them for the life of the server process.
+    """
+    if key not in st.session_state:
+        fig = Figure(figsize=figsize)
+        st.session_state[key] = (fig, fig.subplots())
+    return st.session_state[key]
+
+
+def _build_equity_fig():
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    (portfolio_line,) = ax.plot([], [], color="#2E86AB", linewidth=2)
+    (benchmark_line,) = ax.plot(
+        [], [], color="#A23B72", linestyle="--", linewidth=2
+    )
+    ax.set_ylabel("Portfolio Value ($)")
+    ax.grid(alpha=0.3, linestyle="--")
+    ax.yaxis.set_major_formatter(
+        plt.FuncFormatter(lambda x, _: f"${x:,.0f}")
+    )
+    return fig, ax, portfolio_line, benchmark_line
 
 
 def render_equity_curve_chart(
@@ -88,35 +120,30 @@ def render_equity_curve_chart(
     start: str,
     end: str,
 ) -> None:
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.plot(
-        portfolio_curve.index,
-        portfolio_curve.values,
-        label=f"Portfolio ({', '.join(tickers)})",
-        color="#2E86AB",
-        linewidth=2,
-    )
+    if "equity_fig" not in st.session_state:
+        st.session_state["equity_fig"] = _build_equity_fig()
+    fig, ax, portfolio_line, benchmark_line = st.session_state["equity_fig"]
+
+    # Update line data in place instead of rebuilding the Figure.
+    portfolio_line.set_data(portfolio_curve.index, portfolio_curve.values)
+    portfolio_line.set_label(f"Portfolio ({', '.join(tickers)})")
 
     if benchmark_curve is not None:
-        ax.plot(
-            benchmark_curve.index,
-            benchmark_curve.values,
-            label="SPY Benchmark",
-            color="#A23B72",
-            linestyle="--",
-            linewidth=2,
-        )
+        benchmark_line.set_data(benchmark_curve.index, benchmark_curve.values)
+        benchmark_line.set_label("SPY Benchmark")
+        benchmark_line.set_visible(True)
+        handles = [portfolio_line, benchmark_line]
+    else:
+        benchmark_line.set_data([], [])
+        benchmark_line.set_visible(False)
+        handles = [portfolio_line]
 
     ax.set_title(f"Equity Curve • {start} → {end}")
-    ax.set_ylabel("Portfolio Value ($)")
-    ax.grid(alpha=0.3, linestyle="--")
-    ax.legend()
-    ax.yaxis.set_major_formatter(
-        plt.FuncFormatter(lambda x, _: f"${x:,.0f}")
-    )
+    ax.relim(visible_only=True)
+    ax.autoscale_view()
+    ax.legend(handles=handles)
     fig.autofmt_xdate()
     st.pyplot(fig)
-    plt.close(fig)
 
 
 def render_drawdown_chart(
@@ -124,7 +151,10 @@ def render_drawdown_chart(
     benchmark_curve: Optional[pd.Series],
 ) -> None:
     portfolio_dd = compute_drawdown(portfolio_curve) * 100
-    fig, ax = plt.subplots(figsize=(10, 4))
+    # fill_between collections cannot be updated in place, so reuse the
+    # Figure but clear and redraw its axes.
+    fig, ax = _session_figure("drawdown_fig", figsize=(10, 4))
+    ax.clear()
     ax.fill_between(
         portfolio_dd.index,
         portfolio_dd.values,
@@ -160,7 +190,6 @@ def render_drawdown_chart(
     ax.legend()
     fig.autofmt_xdate()
     st.pyplot(fig)
-    plt.close(fig)
 
 
 def render_monthly_returns_chart(
@@ -177,7 +206,8 @@ def render_monthly_returns_chart(
     months = data.index
     x = np.arange(len(months))
 
-    fig, ax = plt.subplots(figsize=(11, 4))
+    fig, ax = _session_figure("monthly_fig", figsize=(11, 4))
+    ax.clear()
 
     width = 0.35 if data.shape[1] > 1 else 0.6
     ax.bar(
@@ -205,7 +235,6 @@ def render_monthly_returns_chart(
     ax.grid(axis="y", alpha=0.2)
     ax.legend()
     st.pyplot(fig)
-    plt.close(fig)
 
 
 st.title("📊 Market Simulator")
@@ -306,14 +335,17 @@ else:
 
     try:
         with st.spinner("Downloading price data and running backtest..."):
-            prices = load_price_data(tuple(tickers), start_str, end_str)
+            # Fetch SPY alongside the portfolio tickers so benchmarking
+            # never needs a second download.
+            all_tickers = tuple(dict.fromkeys(list(tickers) + ["SPY"]))
+            price_data = load_price_data(all_tickers, start_str, end_str)
 
-        if prices.empty:
+        if price_data.empty:
             st.error("No price data returned for the selected tickers/dates.")
             st.stop()
 
-        available_columns = [col for col in prices.columns if col in tickers]
-        missing_tickers = [ticker for ticker in tickers if ticker not in prices.columns]
+        available_columns = [col for col in price_data.columns if col in tickers]
+        missing_tickers = [ticker for ticker in tickers if ticker not in price_data.columns]
 
         if missing_tickers:
             st.warning(
@@ -325,7 +357,7 @@ else:
             st.error("No valid tickers remain after filtering missing data.")
             st.stop()
 
-        prices = prices[available_columns]
+        prices = price_data[available_columns]
 
         if use_custom_weights and weights_map:
             raw_weights = np.array(
@@ -358,7 +390,10 @@ else:
         spy_metrics = None
 
         if include_spy:
-            spy_prices = load_price_data(("SPY",), start_str, end_str)
+            if "SPY" in price_data.columns:
+                spy_prices = price_data[["SPY"]]
+            else:
+                spy_prices = load_price_data(("SPY",), start_str, end_str)
             spy_equity_curve, spy_returns = backtest_portfolio(
                 spy_prices, [1.0], initial_investment
             )
@@ -402,12 +437,16 @@ else:
     if spy_metrics:
         metrics_df["SPY"] = pd.Series(spy_metrics)
 
-    formatted_metrics = metrics_df.copy()
-    for column in formatted_metrics.columns:
-        formatted_metrics[column] = [
-            format_metric_value(metric, value)
-            for metric, value in zip(metrics_df.index, metrics_df[column])
-        ]
+    # One vectorized map per format group instead of a per-cell loop;
+    # this runs on every rerender, so keep it out of Python-level loops.
+    pct_mask = metrics_df.index.isin(
+        ["total_return", "annual_return", "annual_vol", "max_drawdown"]
+    )
+    formatted_metrics = metrics_df.astype(object)
+    formatted_metrics.loc[pct_mask] = metrics_df.loc[pct_mask].map(lambda v: f"{v:.2%}")
+    formatted_metrics.loc[~pct_mask] = metrics_df.loc[~pct_mask].map(
+        lambda v: f"{v:.4f}" if not math.isnan(v) else "N/A"
+    )
 
     st.dataframe(
         formatted_metrics,
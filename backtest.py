@@ -1,37 +1,147 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+
 import numpy as np
 import pandas as pd
 
+from _kernels import NUMBA_AVAILABLE, run_backtest, run_metrics
+
 def compute_returns(prices: pd.DataFrame):
-    returns = prices.pct_change().dropna()
-    return returns
+    # pct_change would allocate a NaN-prefixed copy and dropna another;
+    # the only all-NaN row is the known first one, so slice directly.
+    arr = prices.to_numpy()
+    rets = arr[1:] / arr[:-1] - 1.0
+    return pd.DataFrame(rets, index=prices.index[1:], columns=prices.columns)
 
 def backtest_portfolio(prices, weights, initial_amount: float = 10_000):
-    results = compute_returns(prices)
-    
-    w = np.array(weights, dtype=float)
+    # Single fused numpy pass over the raw ndarray instead of chained
+    # pandas ops (pct_change -> dropna -> weighted sum -> cumprod), which
+    # each allocate a full intermediate DataFrame. float32 halves the
+    # memory traffic of this bandwidth-bound sweep; compute_metrics
+    # upcasts to float64 before its mean/std reductions. Fortran order
+    # keeps each ticker's time series contiguous, so the per-column
+    # streams stay cache-line friendly for the few-column case.
+    # Rows with missing prices (e.g. a ticker that listed mid-range)
+    # would propagate NaN through the cumprod; drop them up front like
+    # the old pct_change().dropna() pipeline did.
+    prices = prices.dropna()
+    P = np.asfortranarray(prices.to_numpy(dtype=np.float32))
+
+    w = np.asarray(weights, dtype=np.float32)
     w = w / w.sum()
-    
-    port_returns = (results * w).sum(axis=1)
-    
-    equity_curve = (1 + port_returns).cumprod() * initial_amount
-    
+
+    if NUMBA_AVAILABLE:
+        eq, port = run_backtest(P, w, float(initial_amount))
+    else:
+        rets = P[1:] / P[:-1] - 1.0
+        port = rets @ w
+
+        eq = np.empty_like(port)
+        np.add(port, 1.0, out=eq)
+        np.cumprod(eq, out=eq)
+        eq *= initial_amount
+
+    index = prices.index[1:]
+    equity_curve = pd.Series(eq, index=index)
+    port_returns = pd.Series(port, index=index)
+
     return equity_curve, port_returns
 
 
+def monthly_compound_returns(returns: pd.Series) -> pd.Series:
+    """Compound daily returns into month-end returns.
+
+    Equivalent to `(1 + returns).resample('M').prod() - 1` (minus empty
+    months), but works in log space and reduces each month's block with
+    one np.add.reduceat over precomputed month boundaries, skipping
+    pandas' offset-aware resample machinery.
+    """
+    if returns.empty:
+        return pd.Series(dtype=np.float64)
+
+    log_rets = np.log1p(returns.to_numpy(dtype=np.float64))
+    idx = returns.index
+    month_id = idx.year * 12 + idx.month
+    month_starts = np.flatnonzero(np.r_[True, month_id[1:] != month_id[:-1]])
+    monthly = np.expm1(np.add.reduceat(log_rets, month_starts))
+
+    month_last = np.r_[month_starts[1:] - 1, len(idx) - 1]
+    month_ends = idx[month_last].to_period("M").to_timestamp("M")
+    return pd.Series(monthly, index=month_ends)
+
+
+# Set per worker by _attach_shared_prices; holds the attached segment and
+# a zero-copy DataFrame view over it.
+_shared_prices = None
+
+
+def _attach_shared_prices(shm_name, shape, dtype_str, index, columns):
+    global _shared_prices
+    shm = SharedMemory(name=shm_name)
+    arr = np.ndarray(shape, dtype=np.dtype(dtype_str), buffer=shm.buf)
+    frame = pd.DataFrame(arr, index=index, columns=columns, copy=False)
+    # Keep a reference to shm so the buffer outlives this initializer.
+    _shared_prices = (shm, frame)
+
+
+def _backtest_shared(weights, initial_amount):
+    _, prices = _shared_prices
+    return backtest_portfolio(prices, weights, initial_amount)
+
+
+def backtest_many(prices, weights_list, initial_amount: float = 10_000):
+    """Run backtest_portfolio for each weight vector, fanned out over a
+    process pool.
+
+    The price array is placed in a SharedMemory segment once and every
+    worker attaches to it zero-copy, so only the small weight vectors
+    are pickled per task. Each backtest is CPU-bound and independent, so
+    a weight sweep scales near-linearly with core count. Returns a list
+    of (equity_curve, port_returns) tuples in the order of
+    `weights_list`.
+    """
+    P = np.ascontiguousarray(prices.to_numpy(dtype=np.float32))
+    shm = SharedMemory(create=True, size=P.nbytes)
+    try:
+        buf = np.ndarray(P.shape, dtype=P.dtype, buffer=shm.buf)
+        buf[:] = P
+        with ProcessPoolExecutor(
+            initializer=_attach_shared_prices,
+            initargs=(shm.name, P.shape, P.dtype.str, prices.index, prices.columns),
+        ) as executor:
+            return list(
+                executor.map(
+                    partial(_backtest_shared, initial_amount=initial_amount),
+                    weights_list,
+                )
+            )
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 def compute_metrics(equity_curve, port_returns, risk_free_rate: float = 0.0):
-    total_returns = equity_curve.iloc[-1] / equity_curve.iloc[0] - 1  #last minus first
-    
-    daily_mean_return = port_returns.mean()
-    daily_vol = port_returns.std()
+    eq = equity_curve.to_numpy(dtype=np.float64)
+    rets = port_returns.to_numpy(dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        total_returns, daily_mean_return, daily_vol, max_drawdown = run_metrics(eq, rets)
+    else:
+        total_returns = eq[-1] / eq[0] - 1  #last minus first
+        daily_mean_return = rets.mean()
+        daily_vol = rets.std(ddof=1)
+        # Reuse one buffer: running max, then in-place drawdown, then min.
+        buf = np.maximum.accumulate(eq)
+        np.divide(eq, buf, out=buf)
+        buf -= 1.0
+        max_drawdown = buf.min()
+
     annual_return = daily_mean_return * 252
     annual_vol = daily_vol * np.sqrt(252)
-    
+
     sharpe = (annual_return - risk_free_rate) / annual_vol if annual_vol != 0 else np.nan
-    
-    running_max = equity_curve.cummax()
-    drawdown = equity_curve / running_max - 1
-    max_drawdown = drawdown.min()
-    
+
     return {
         "total_return": total_returns,
         "annual_return": annual_return,
@@ -1,21 +1,66 @@
-import pandas as pd 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
 import yfinance as yf
 
+from _cache import cache_path, load_cached, store, ttl_for
+
+def _fetch_close(ticker, start, end):
+    closes = yf.Ticker(ticker).history(start=start, end=end, auto_adjust=True)['Close']
+    # yf.Ticker returns a tz-aware index; drop it to match yf.download
+    closes.index = closes.index.tz_localize(None)
+    return closes
+
 def get_price_data(tickers, start='2018-01-01', end='2025-11-01'):
-    data = yf.download(tickers, start=start,end=end, auto_adjust=True)
-    
-    
-    if isinstance(tickers, str):
-        if 'Close' in data.columns:
-            data = data[['Close']]
+    path = cache_path(tickers, start, end)
+    cached = load_cached(path, ttl_for(end))
+    if cached is not None:
+        return cached
+
+    single = isinstance(tickers, str)
+    ticker_list = [tickers] if single else list(tickers)
+
+    # Fetch each ticker on its own thread: the work is network-bound, so
+    # the GIL is released during the HTTP round trips and the downloads
+    # overlap instead of running back to back.
+    series = {}
+    with ThreadPoolExecutor(max_workers=min(16, len(ticker_list))) as executor:
+        futures = {
+            executor.submit(_fetch_close, ticker, start, end): ticker
+            for ticker in ticker_list
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                series[ticker] = future.result()
+            except Exception:
+                # Unknown ticker or transient fetch error: skip it, like
+                # yf.download drops tickers it cannot resolve.
+                pass
+
+    if series:
+        data = pd.concat(series, axis=1)
+        data = data[[t for t in ticker_list if t in data.columns]]
+        if single:
+            data.columns = ['Close']
     else:
+        # Concurrent path came back empty; fall back to the batched call.
+        data = yf.download(
+            ticker_list,
+            start=start,
+            end=end,
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+            group_by='column',
+        )
         if 'Close' in data.columns:
-            data = data['Close']
-    # if isinstance(data, pd.Series):
-    #     data = data.to_frame()
+            data = data[['Close']] if single else data['Close']
 
     data = data.dropna(how="all")
-    
+
+    store(path, data)
+
     return data
-    
-    
\ No newline at end of file
+
+
@@ -4,6 +4,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from backtest import monthly_compound_returns
+
 def plot_equity_curves(portfolio_curve, spy_curve, tickers, start_date, end_date, save_path=None):
     """
     Plot portfolio equity curve vs SPY benchmark.
@@ -116,8 +118,8 @@ def plot_monthly_returns(portfolio_returns, spy_returns, save_path=None):
         save_path: optional path to save the figure
     """
     # Convert to monthly returns
-    portfolio_monthly = (1 + portfolio_returns).resample('M').prod() - 1
-    spy_monthly = (1 + spy_returns).resample('M').prod() - 1
+    portfolio_monthly = monthly_compound_returns(portfolio_returns)
+    spy_monthly = monthly_compound_returns(spy_returns)
     
     fig, ax = plt.subplots(figsize=(14, 6))
     